@@ -7,7 +7,7 @@ import json
 import asyncio
 import gradio as gr
 from typing import Optional, Dict,  List, Tuple
-import requests
+import aiohttp
 import networkx as nx
 import matplotlib
 import matplotlib.pyplot as plt
@@ -750,15 +750,22 @@ async def text_interaction_async(text, student_id):
             response = await session.call_tool("text_interaction", {"query": text, "student_id": student_id})
             return await extract_response_content(response)
 
+# Bound connect/read so a hung storage backend cannot stall the UI indefinitely
+STORAGE_UPLOAD_TIMEOUT = aiohttp.ClientTimeout(sock_connect=3, sock_read=10)
+
 async def upload_file_to_storage(file_path):
     """Helper function to upload file to storage API"""
     try:
         url = "https://storage-bucket-api.vercel.app/upload"
         with open(file_path, 'rb') as f:
-            files = {'file': (os.path.basename(file_path), f)}
-            response = requests.post(url, files=files)
-            response.raise_for_status()
-            return response.json()
+            # aiohttp streams the file object in chunks without blocking the event loop
+            data = aiohttp.FormData()
+            data.add_field('file', f, filename=os.path.basename(file_path),
+                           content_type='application/octet-stream')
+            async with aiohttp.ClientSession(timeout=STORAGE_UPLOAD_TIMEOUT) as session:
+                async with session.post(url, data=data) as response:
+                    response.raise_for_status()
+                    return await response.json()
     except Exception as e:
         return {"error": f"Error uploading file to storage: {str(e)}", "success": False}
 
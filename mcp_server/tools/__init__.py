@@ -25,6 +25,7 @@ from .learning_path_tools import (  # noqa
     optimize_learning_strategy,
     start_adaptive_session,
     record_learning_event,
+    record_learning_events,
     get_adaptive_recommendations,
     get_adaptive_learning_path,
     get_student_progress_summary
@@ -58,6 +59,7 @@ __all__ = [
     'optimize_learning_strategy',
     'start_adaptive_session',
     'record_learning_event',
+    'record_learning_events',
     'get_adaptive_recommendations',
     'get_adaptive_learning_path',
     'get_student_progress_summary',
@@ -682,63 +682,119 @@ async def record_learning_event(student_id: str, concept_id: str, session_id: st
         Event recording confirmation and updated recommendations
     """
     try:
-        # Record the event
-        event = LearningEvent(
-            student_id=student_id,
-            concept_id=concept_id,
-            event_type=event_type,
-            timestamp=datetime.utcnow(),
-            data=event_data
-        )
-        learning_events.append(event)
+        performance = _apply_learning_event(student_id, concept_id, session_id, event_type, event_data)
+        return _learning_event_summary(performance)
+    except Exception as e:
+        return {"success": False, "error": str(e)}
 
-        # Update session
-        if session_id in active_sessions:
-            session = active_sessions[session_id]
-            session['events'].append(event)
+@mcp.tool()
+async def record_learning_events(student_id: str, concept_id: str, session_id: str,
+                                events: list) -> dict:
+    """
+    Record a batch of learning events for adaptive analysis in a single call.
 
-            if event_type in ['answer_correct', 'answer_incorrect']:
-                session['questions_answered'] += 1
-                if event_type == 'answer_correct':
-                    session['correct_answers'] += 1
+    The batch is validated up front and nothing is recorded if any event is
+    malformed.
 
-        # Update student performance
-        performance = get_student_performance(student_id, concept_id)
-        performance.attempts_count += 1
+    Args:
+        student_id: Student identifier
+        concept_id: Concept identifier
+        session_id: Session identifier
+        events: List of events, each a dict with 'event_type' and optional 'event_data'
 
-        if event_type == 'answer_correct':
-            performance.accuracy_rate = (performance.accuracy_rate * (performance.attempts_count - 1) + 1.0) / performance.attempts_count
-        elif event_type == 'answer_incorrect':
-            performance.accuracy_rate = (performance.accuracy_rate * (performance.attempts_count - 1) + 0.0) / performance.attempts_count
-        elif event_type == 'time_spent':
-            performance.time_spent_minutes += event_data.get('minutes', 0)
+    Returns:
+        Recording confirmation and recommendations based on the updated performance
+    """
+    try:
+        if not events or not isinstance(events, list):
+            return {"success": False, "error": "events must be a non-empty list"}
+
+        # Validate the whole batch first so a bad entry records nothing
+        parsed_events = []
+        for index, event in enumerate(events):
+            if not isinstance(event, dict) or not isinstance(event.get("event_type"), str):
+                return {"success": False, "error": f"events[{index}] must be a dict with a string 'event_type'"}
+            event_data = event.get("event_data", {})
+            if not isinstance(event_data, dict):
+                return {"success": False, "error": f"events[{index}].event_data must be a dict"}
+            if event["event_type"] == "time_spent" and not isinstance(event_data.get("minutes", 0), (int, float)):
+                return {"success": False, "error": f"events[{index}].event_data.minutes must be a number"}
+            parsed_events.append((event["event_type"], event_data))
+
+        performance = None
+        for event_type, event_data in parsed_events:
+            performance = _apply_learning_event(
+                student_id, concept_id, session_id, event_type, event_data
+            )
+
+        summary = _learning_event_summary(performance)
+        summary["events_recorded"] = len(events)
+        return summary
+    except Exception as e:
+        return {"success": False, "error": str(e)}
 
-        # Update mastery level
-        new_mastery = update_mastery_level(performance)
+def _apply_learning_event(student_id: str, concept_id: str, session_id: str,
+                          event_type: str, event_data: dict) -> StudentPerformance:
+    """Store a learning event and fold it into the session and performance state."""
+    event = LearningEvent(
+        student_id=student_id,
+        concept_id=concept_id,
+        event_type=event_type,
+        timestamp=datetime.utcnow(),
+        data=event_data
+    )
+    learning_events.append(event)
 
-        # Adapt difficulty
-        new_difficulty = adapt_difficulty(performance)
+    # Update session
+    if session_id in active_sessions:
+        session = active_sessions[session_id]
+        session['events'].append(event)
 
-        # Generate recommendations
-        recommendations = []
-        if performance.accuracy_rate > 0.8 and performance.attempts_count >= 3:
-            recommendations.append("Great job! Consider moving to a harder difficulty level.")
-        elif performance.accuracy_rate < 0.5 and performance.attempts_count >= 3:
-            recommendations.append("Let's try some easier questions to build confidence.")
+        if event_type in ['answer_correct', 'answer_incorrect']:
+            session['questions_answered'] += 1
+            if event_type == 'answer_correct':
+                session['correct_answers'] += 1
 
-        if new_mastery > 0.8:
-            recommendations.append("You're mastering this concept! Ready for the next one?")
+    # Update student performance
+    performance = get_student_performance(student_id, concept_id)
+    performance.attempts_count += 1
 
-        return {
-            "success": True,
-            "event_recorded": True,
-            "updated_mastery": new_mastery,
-            "updated_difficulty": new_difficulty,
-            "current_accuracy": performance.accuracy_rate,
-            "recommendations": recommendations
-        }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    if event_type == 'answer_correct':
+        performance.accuracy_rate = (performance.accuracy_rate * (performance.attempts_count - 1) + 1.0) / performance.attempts_count
+    elif event_type == 'answer_incorrect':
+        performance.accuracy_rate = (performance.accuracy_rate * (performance.attempts_count - 1) + 0.0) / performance.attempts_count
+    elif event_type == 'time_spent':
+        performance.time_spent_minutes += event_data.get('minutes', 0)
+
+    # Update mastery level and adapt difficulty after every event
+    update_mastery_level(performance)
+    adapt_difficulty(performance)
+
+    return performance
+
+def _learning_event_summary(performance: StudentPerformance) -> dict:
+    """Build the event recording response from the updated performance."""
+    new_mastery = performance.mastery_level
+    new_difficulty = performance.difficulty_preference
+
+    # Generate recommendations
+    recommendations = []
+    if performance.accuracy_rate > 0.8 and performance.attempts_count >= 3:
+        recommendations.append("Great job! Consider moving to a harder difficulty level.")
+    elif performance.accuracy_rate < 0.5 and performance.attempts_count >= 3:
+        recommendations.append("Let's try some easier questions to build confidence.")
+
+    if new_mastery > 0.8:
+        recommendations.append("You're mastering this concept! Ready for the next one?")
+
+    return {
+        "success": True,
+        "event_recorded": True,
+        "updated_mastery": new_mastery,
+        "updated_difficulty": new_difficulty,
+        "current_accuracy": performance.accuracy_rate,
+        "recommendations": recommendations
+    }
 
 @mcp.tool()
 async def get_adaptive_recommendations(student_id: str, concept_id: str, session_id: str = None) -> dict:
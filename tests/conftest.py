@@ -0,0 +1,60 @@
+"""
+Shared pytest configuration for the TutorX test suite.
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+
+# Make the project root importable once for every test module
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on the one session-wide event loop.
+
+    Sharing the loop lets module-scoped fixtures such as the MCP session be
+    reused across tests instead of being torn down with each test's loop.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def mcp_session(mcp_server_url):
+    """One SSE connection and MCP handshake shared by every test in a module.
+
+    Modules point this at a server by defining an ``mcp_server_url`` fixture.
+    pytest-asyncio may run fixture setup and teardown in different tasks, but
+    the anyio cancel scopes inside sse_client must be exited by the task that
+    entered them, so a background task owns the connection for its lifetime.
+    """
+    ready = asyncio.get_running_loop().create_future()
+    stop = asyncio.Event()
+
+    async def hold_session():
+        try:
+            async with sse_client(mcp_server_url) as (sse, write):
+                async with ClientSession(sse, write) as session:
+                    await session.initialize()
+                    ready.set_result(session)
+                    await stop.wait()
+        except Exception as e:
+            if ready.done():
+                raise
+            ready.set_exception(e)
+
+    task = asyncio.create_task(hold_session())
+    try:
+        yield await ready
+    finally:
+        stop.set()
+        await task
@@ -6,11 +6,6 @@ Tests the contextualized AI tutoring and automated content generation.
 
 import asyncio
 import json
-import sys
-import os
-
-# Add the current directory to the Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from mcp_server.tools.ai_tutor_tools import (
     start_tutoring_session,
@@ -2,16 +2,11 @@
 Tests for the TutorX MCP client
 """
 
-import sys
-import os
 import unittest
 from unittest.mock import patch, MagicMock
 import json
 import requests
 
-# Add parent directory to path to import modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from client import TutorXClient
 
 
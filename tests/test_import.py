@@ -4,11 +4,6 @@ Simple test script to verify adaptive learning imports work correctly.
 """
 
 import sys
-from pathlib import Path
-
-# Add the project root to the Python path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
 
 def test_imports():
     """Test all adaptive learning imports."""
@@ -3,12 +3,6 @@ Test script for Interactive Quiz functionality
 """
 import asyncio
 import json
-import sys
-from pathlib import Path
-
-# Add the current directory to the Python path
-current_dir = Path(__file__).parent
-sys.path.insert(0, str(current_dir))
 
 # Import the interactive quiz tools
 from mcp_server.tools.quiz_tools import (
@@ -2,16 +2,11 @@
 Tests for the TutorX MCP server
 """
 
-import sys
-import os
 import unittest
 import json
 from datetime import datetime
 from unittest.mock import patch, MagicMock
 
-# Add parent directory to path to import modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from main import assess_skill, generate_quiz, get_concept_graph
 
 
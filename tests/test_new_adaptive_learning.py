@@ -1,106 +1,147 @@
 """
-Test script for the new adaptive learning implementation.
+Tests for the new adaptive learning implementation.
 """
-import asyncio
-import sys
-import os
-from pathlib import Path
+import logging
 
-# Add the current directory to the Python path
-current_dir = Path(__file__).parent
-sys.path.insert(0, str(current_dir))
+import pytest_asyncio
 
 # Import the adaptive learning tools
 from mcp_server.tools.learning_path_tools import (
+    learning_events,
     start_adaptive_session,
     record_learning_event,
+    record_learning_events,
     get_adaptive_recommendations,
     get_adaptive_learning_path,
-    get_student_progress_summary
+    get_student_progress_summary,
+    get_student_performance
 )
 
-async def test_adaptive_learning():
-    """Test the new adaptive learning system."""
-    print("🧠 Testing New Adaptive Learning System")
-    print("=" * 50)
-    
-    # Test 1: Start an adaptive session
-    print("\n1. Starting adaptive session...")
+logger = logging.getLogger(__name__)
+
+STUDENT_ID = "test_student_001"
+CONCEPT_ID = "algebra_linear_equations"
+
+# Enough answers to move difficulty, plus study time to move mastery
+EQUIVALENCE_EVENTS = [
+    {"event_type": "answer_correct", "event_data": {"time_taken": 25}},
+    {"event_type": "answer_correct", "event_data": {"time_taken": 20}},
+    {"event_type": "time_spent", "event_data": {"minutes": 12}},
+    {"event_type": "answer_incorrect", "event_data": {"time_taken": 45}},
+    {"event_type": "answer_correct", "event_data": {"time_taken": 18}},
+    {"event_type": "answer_correct", "event_data": {"time_taken": 15}}
+]
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def adaptive_session():
+    """Start one adaptive session for the module and yield its id.
+
+    Tests run in file order, so test_recommendations sees the events that
+    test_record_events recorded on this session.
+    """
     session_result = await start_adaptive_session(
-        student_id="test_student_001",
-        concept_id="algebra_linear_equations",
+        student_id=STUDENT_ID,
+        concept_id=CONCEPT_ID,
         initial_difficulty=0.5
     )
-    print(f"Session Result: {session_result}")
-    
-    if session_result.get("success"):
-        session_id = session_result.get("session_id")
-        print(f"✅ Session started successfully: {session_id}")
-        
-        # Test 2: Record some learning events
-        print("\n2. Recording learning events...")
-        
-        # Record a correct answer
-        event_result1 = await record_learning_event(
-            student_id="test_student_001",
-            concept_id="algebra_linear_equations",
-            session_id=session_id,
-            event_type="answer_correct",
-            event_data={"time_taken": 25, "difficulty": 0.5}
-        )
-        print(f"Event 1 (correct): {event_result1}")
-        
-        # Record an incorrect answer
-        event_result2 = await record_learning_event(
-            student_id="test_student_001",
-            concept_id="algebra_linear_equations",
-            session_id=session_id,
-            event_type="answer_incorrect",
-            event_data={"time_taken": 45, "difficulty": 0.5}
-        )
-        print(f"Event 2 (incorrect): {event_result2}")
-        
-        # Record another correct answer
-        event_result3 = await record_learning_event(
-            student_id="test_student_001",
-            concept_id="algebra_linear_equations",
-            session_id=session_id,
-            event_type="answer_correct",
-            event_data={"time_taken": 20, "difficulty": 0.5}
-        )
-        print(f"Event 3 (correct): {event_result3}")
-        
-        # Test 3: Get adaptive recommendations
-        print("\n3. Getting adaptive recommendations...")
-        recommendations = await get_adaptive_recommendations(
-            student_id="test_student_001",
-            concept_id="algebra_linear_equations",
-            session_id=session_id
-        )
-        print(f"Recommendations: {recommendations}")
-        
-        # Test 4: Get adaptive learning path
-        print("\n4. Getting adaptive learning path...")
-        learning_path = await get_adaptive_learning_path(
-            student_id="test_student_001",
-            target_concepts=["algebra_basics", "linear_equations", "quadratic_equations"],
-            strategy="adaptive",
-            max_concepts=5
-        )
-        print(f"Learning Path: {learning_path}")
-        
-        # Test 5: Get progress summary
-        print("\n5. Getting progress summary...")
-        progress = await get_student_progress_summary(
-            student_id="test_student_001",
-            days=7
+    logger.debug("Session Result: %s", session_result)
+    assert session_result["success"], session_result
+    yield session_result["session_id"]
+
+async def test_record_events(adaptive_session):
+    """Record a correct, an incorrect and a correct answer in one batch."""
+    events_result = await record_learning_events(
+        student_id=STUDENT_ID,
+        concept_id=CONCEPT_ID,
+        session_id=adaptive_session,
+        events=[
+            {"event_type": "answer_correct", "event_data": {"time_taken": 25, "difficulty": 0.5}},
+            {"event_type": "answer_incorrect", "event_data": {"time_taken": 45, "difficulty": 0.5}},
+            {"event_type": "answer_correct", "event_data": {"time_taken": 20, "difficulty": 0.5}}
+        ]
+    )
+    logger.debug("Events (correct, incorrect, correct): %s", events_result)
+    assert events_result["success"], events_result
+    assert events_result["events_recorded"] == 3
+
+async def test_recommendations(adaptive_session):
+    """Get adaptive recommendations for the session after its events."""
+    recommendations = await get_adaptive_recommendations(
+        student_id=STUDENT_ID,
+        concept_id=CONCEPT_ID,
+        session_id=adaptive_session
+    )
+    logger.debug("Recommendations: %s", recommendations)
+    assert recommendations["success"], recommendations
+
+async def test_learning_path():
+    """Get an adaptive learning path for the student."""
+    learning_path = await get_adaptive_learning_path(
+        student_id=STUDENT_ID,
+        target_concepts=["algebra_basics", "linear_equations", "quadratic_equations"],
+        strategy="adaptive",
+        max_concepts=5
+    )
+    logger.debug("Learning Path: %s", learning_path)
+    assert learning_path["success"], learning_path
+
+async def test_progress():
+    """Get the student's progress summary."""
+    progress = await get_student_progress_summary(
+        student_id=STUDENT_ID,
+        days=7
+    )
+    logger.debug("Progress Summary: %s", progress)
+    assert progress["success"], progress
+
+async def test_batch_matches_sequential_events():
+    """A batch ends in the same state as recording its events one at a time."""
+    batch_session = await start_adaptive_session("batch_student", CONCEPT_ID, 0.5)
+    sequential_session = await start_adaptive_session("sequential_student", CONCEPT_ID, 0.5)
+
+    batch_result = await record_learning_events(
+        student_id="batch_student",
+        concept_id=CONCEPT_ID,
+        session_id=batch_session["session_id"],
+        events=EQUIVALENCE_EVENTS
+    )
+    for event in EQUIVALENCE_EVENTS:
+        sequential_result = await record_learning_event(
+            student_id="sequential_student",
+            concept_id=CONCEPT_ID,
+            session_id=sequential_session["session_id"],
+            event_type=event["event_type"],
+            event_data=event["event_data"]
         )
-        print(f"Progress Summary: {progress}")
-        
-        print("\n✅ All tests completed successfully!")
-        
-    else:
-        print("❌ Failed to start session")
-
-if __name__ == "__main__":
-    asyncio.run(test_adaptive_learning())
+
+    assert batch_result["success"], batch_result
+    for key in ("updated_mastery", "updated_difficulty", "current_accuracy", "recommendations"):
+        assert batch_result[key] == sequential_result[key], key
+
+    batch_performance = get_student_performance("batch_student", CONCEPT_ID)
+    sequential_performance = get_student_performance("sequential_student", CONCEPT_ID)
+    for attr in ("mastery_level", "difficulty_preference", "accuracy_rate",
+                 "attempts_count", "time_spent_minutes"):
+        assert getattr(batch_performance, attr) == getattr(sequential_performance, attr), attr
+
+async def test_invalid_batch_records_nothing():
+    """A malformed event rejects the whole batch before anything is stored."""
+    session = await start_adaptive_session("invalid_batch_student", CONCEPT_ID, 0.5)
+    performance = get_student_performance("invalid_batch_student", CONCEPT_ID)
+    events_before = len(learning_events)
+    attempts_before = performance.attempts_count
+
+    result = await record_learning_events(
+        student_id="invalid_batch_student",
+        concept_id=CONCEPT_ID,
+        session_id=session["session_id"],
+        events=[
+            {"event_type": "answer_correct", "event_data": {"time_taken": 25}},
+            {"event_data": {"time_taken": 45}}
+        ]
+    )
+
+    assert not result["success"]
+    assert "events[1]" in result["error"]
+    assert len(learning_events) == events_before
+    assert performance.attempts_count == attempts_before
@@ -1,107 +1,72 @@
 import pytest
 import asyncio
 import base64
+import io
 import os
 from mcp import ClientSession
 from mcp.client.sse import sse_client
 
+# Under pytest-xdist each worker opens its own session, so the server must accept parallel clients
 SERVER_URL = "http://localhost:8000/sse"  # Adjust if needed
 
-@pytest.mark.asyncio
-async def test_get_concept_graph_tool():
-    async with sse_client(SERVER_URL) as (sse, write):
-        async with ClientSession(sse, write) as session:
-            await session.initialize()
-            result = await session.call_tool("get_concept_graph_tool", {"concept_id": "python"})
-            assert result and "error" not in result
-
-@pytest.mark.asyncio
-async def test_generate_quiz_tool():
-    async with sse_client(SERVER_URL) as (sse, write):
-        async with ClientSession(sse, write) as session:
-            await session.initialize()
-            result = await session.call_tool("generate_quiz_tool", {"concept": "python", "difficulty": "easy"})
-            assert result and "error" not in result
+# Constant OCR payloads, encoded once at import time
+_PDF_B64 = base64.b64encode(b"%PDF-1.4 test pdf content").decode("utf-8")
 
-@pytest.mark.asyncio
-async def test_generate_lesson_tool():
-    async with sse_client(SERVER_URL) as (sse, write):
-        async with ClientSession(sse, write) as session:
-            await session.initialize()
-            result = await session.call_tool("generate_lesson_tool", {"topic": "Algebra", "grade_level": 8, "duration_minutes": 45})
-            assert result and "error" not in result
+try:
+    from PIL import Image
+    _buf = io.BytesIO()
+    Image.new("RGB", (1, 1), color="white").save(_buf, format="PNG")  # 1x1 pixel PNG
+    _TINY_PNG_B64 = base64.b64encode(_buf.getvalue()).decode("utf-8")
+    del _buf
+except ImportError:
+    _TINY_PNG_B64 = None
 
-@pytest.mark.asyncio
-async def test_get_learning_path():
-    async with sse_client(SERVER_URL) as (sse, write):
-        async with ClientSession(sse, write) as session:
-            await session.initialize()
-            result = await session.call_tool("get_learning_path", {"student_id": "student_1", "concept_ids": ["python", "oop"], "student_level": "beginner"})
-            assert result and "error" not in result
+@pytest.fixture(scope="module")
+def mcp_server_url():
+    """Point the shared mcp_session fixture at the external server."""
+    return SERVER_URL
 
-@pytest.mark.asyncio
-async def test_text_interaction():
-    async with sse_client(SERVER_URL) as (sse, write):
-        async with ClientSession(sse, write) as session:
-            await session.initialize()
-            result = await session.call_tool("text_interaction", {"query": "What is a function in Python?", "student_id": "student_1"})
-            assert result and "error" not in result
+# Pillow builds the PNG payload, so image_to_text can only run when it is installed
+_NEEDS_PILLOW = pytest.mark.skipif(_TINY_PNG_B64 is None, reason="Pillow is not installed")
 
-@pytest.mark.asyncio
-async def test_check_submission_originality():
-    async with sse_client(SERVER_URL) as (sse, write):
-        async with ClientSession(sse, write) as session:
-            await session.initialize()
-            result = await session.call_tool("check_submission_originality", {"submission": "Python is a programming language.", "reference_sources": ["Python is a programming language.", "Java is another language."]})
-            assert result and "error" not in result
+# (tool, arguments) for every tool expected to return a result without an error.
+# pdf_ocr is tested separately because the placeholder PDF may fail to parse.
+TOOL_CALLS = [
+    pytest.param("get_concept_graph_tool", {"concept_id": "python"}, id="get_concept_graph_tool"),
+    pytest.param("generate_quiz_tool", {"concept": "python", "difficulty": "easy"}, id="generate_quiz_tool"),
+    pytest.param("generate_lesson_tool", {"topic": "Algebra", "grade_level": 8, "duration_minutes": 45}, id="generate_lesson_tool"),
+    pytest.param("get_learning_path", {"student_id": "student_1", "concept_ids": ["python", "oop"], "student_level": "beginner"}, id="get_learning_path"),
+    pytest.param("text_interaction", {"query": "What is a function in Python?", "student_id": "student_1"}, id="text_interaction"),
+    pytest.param("check_submission_originality", {"submission": "Python is a programming language.", "reference_sources": ["Python is a programming language.", "Java is another language."]}, id="check_submission_originality"),
+    pytest.param("image_to_text", {"image_data": _TINY_PNG_B64}, id="image_to_text", marks=_NEEDS_PILLOW),
+    pytest.param("get_concept_tool", {"concept_id": "python"}, id="get_concept_tool"),
+    pytest.param("assess_skill_tool", {"student_id": "student_1", "concept_id": "python"}, id="assess_skill_tool"),
+]
 
-@pytest.mark.asyncio
-async def test_pdf_ocr(tmp_path):
-    # Create a dummy PDF file
-    pdf_path = tmp_path / "test.pdf"
-    with open(pdf_path, "wb") as f:
-        f.write(b"%PDF-1.4 test pdf content")
-    with open(pdf_path, "rb") as f:
-        pdf_data = f.read()
-    pdf_b64 = base64.b64encode(pdf_data).decode("utf-8")
-    async with sse_client(SERVER_URL) as (sse, write):
-        async with ClientSession(sse, write) as session:
-            await session.initialize()
-            result = await session.call_tool("pdf_ocr", {"pdf_data": pdf_b64, "filename": "test.pdf"})
-            assert result and ("error" not in result or "Error processing PDF" in result.get("error", ""))
+@pytest.mark.parametrize("tool, args", TOOL_CALLS)
+async def test_tool(mcp_session, tool, args):
+    result = await mcp_session.call_tool(tool, args)
+    assert result and "error" not in result
 
-@pytest.mark.asyncio
-async def test_image_to_text():
-    # Create a dummy image (1x1 pixel PNG)
-    import io
-    from PIL import Image
-    img = Image.new("RGB", (1, 1), color="white")
-    buf = io.BytesIO()
-    img.save(buf, format="PNG")
-    img_b64 = base64.b64encode(buf.getvalue()).decode("utf-8")
-    async with sse_client(SERVER_URL) as (sse, write):
-        async with ClientSession(sse, write) as session:
-            await session.initialize()
-            result = await session.call_tool("image_to_text", {"image_data": img_b64})
-            assert result and "error" not in result
+async def test_pdf_ocr(mcp_session):
+    result = await mcp_session.call_tool("pdf_ocr", {"pdf_data": _PDF_B64, "filename": "test.pdf"})
+    assert result and ("error" not in result or "Error processing PDF" in result.get("error", ""))
 
-@pytest.mark.asyncio
-async def test_get_concept_tool():
-    async with sse_client(SERVER_URL) as (sse, write):
-        async with ClientSession(sse, write) as session:
-            await session.initialize()
-            result = await session.call_tool("get_concept_tool", {"concept_id": "python"})
-            assert result and "error" not in result
+async def test_all_tools_concurrent(mcp_session):
+    # The tool calls are independent, so issue them together over the shared
+    # session and wait for the slowest one rather than the sum of all of them.
+    calls = [param.values for param in TOOL_CALLS
+             if _TINY_PNG_B64 is not None or _NEEDS_PILLOW not in param.marks]
+    results = await asyncio.gather(*(mcp_session.call_tool(name, args) for name, args in calls))
+    for (name, _), result in zip(calls, results):
+        assert result and "error" not in result, name
 
-@pytest.mark.asyncio
-async def test_assess_skill_tool():
+async def _smoke():
+    """Single tool call for a quick manual check without starting pytest"""
     async with sse_client(SERVER_URL) as (sse, write):
         async with ClientSession(sse, write) as session:
             await session.initialize()
-            result = await session.call_tool("assess_skill_tool", {"student_id": "student_1", "concept_id": "python"})
-            assert result and "error" not in result
+            print(await session.call_tool("get_concept_tool", {"concept_id": "python"}))
 
 if __name__ == "__main__":
-    import sys
-    import pytest
-    sys.exit(pytest.main([__file__])) 
\ No newline at end of file
+    asyncio.run(_smoke())
@@ -5,23 +5,46 @@ This script tests the file upload to the storage API and verifies the OCR functi
 """
 
 import os
-import requests
+import aiohttp
 import asyncio
 import argparse
 from pathlib import Path
 
 # Configuration
 STORAGE_API_URL = "https://storage-bucket-api.vercel.app/upload"
+STORAGE_UPLOAD_TIMEOUT = aiohttp.ClientTimeout(sock_connect=3, sock_read=10)
+
+# Shared HTTP session so repeated uploads reuse keep-alive connections
+_aiohttp_session = None
+
+def _get_session():
+    """Return the shared aiohttp session, creating it on first use"""
+    global _aiohttp_session
+    if _aiohttp_session is None or _aiohttp_session.closed:
+        _aiohttp_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=8),
+            timeout=STORAGE_UPLOAD_TIMEOUT,
+        )
+    return _aiohttp_session
+
+async def _close_session():
+    """Close the shared aiohttp session if one was opened"""
+    global _aiohttp_session
+    if _aiohttp_session is not None:
+        await _aiohttp_session.close()
+        _aiohttp_session = None
 
 async def upload_file_to_storage(file_path):
     """Helper function to upload file to storage API"""
     try:
         with open(file_path, 'rb') as f:
-            files = {'file': (os.path.basename(file_path), f)}
+            data = aiohttp.FormData()
+            data.add_field('file', f, filename=os.path.basename(file_path),
+                           content_type='application/octet-stream')
             print(f"Uploading {file_path} to storage...")
-            response = requests.post(STORAGE_API_URL, files=files)
-            response.raise_for_status()
-            result = response.json()
+            async with _get_session().post(STORAGE_API_URL, data=data) as response:
+                response.raise_for_status()
+                result = await response.json()
             print("\nUpload successful! Response:")
             print(f"- Success: {result.get('success')}")
             print(f"- Message: {result.get('message')}")
@@ -33,8 +56,8 @@ async def upload_file_to_storage(file_path):
             return result
     except Exception as e:
         print(f"Error uploading file: {str(e)}")
-        if hasattr(e, 'response') and e.response is not None:
-            print(f"Server response: {e.response.text}")
+        if isinstance(e, aiohttp.ClientResponseError):
+            print(f"Server response: {e.status} {e.message}")
         return {"error": str(e), "success": False}
 
 async def test_ocr_with_storage_url(storage_url):
@@ -59,21 +82,24 @@ async def main():
         print(f"Error: File not found: {args.file_path}")
         return
     
-    # Upload the file
-    upload_result = await upload_file_to_storage(args.file_path)
-    
-    if not upload_result.get('success'):
-        print("\nUpload failed. Cannot proceed with OCR test.")
-        return
-    
-    storage_url = upload_result.get('storage_url')
-    if not storage_url:
-        print("\nNo storage URL in upload response. Cannot test OCR functionality.")
-        return
-    
-    # Test OCR if requested
-    if args.test_ocr:
-        await test_ocr_with_storage_url(storage_url)
+    try:
+        # Upload the file
+        upload_result = await upload_file_to_storage(args.file_path)
+        
+        if not upload_result.get('success'):
+            print("\nUpload failed. Cannot proceed with OCR test.")
+            return
+        
+        storage_url = upload_result.get('storage_url')
+        if not storage_url:
+            print("\nNo storage URL in upload response. Cannot test OCR functionality.")
+            return
+        
+        # Test OCR if requested
+        if args.test_ocr:
+            await test_ocr_with_storage_url(storage_url)
+    finally:
+        await _close_session()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -2,14 +2,9 @@
 Tests for TutorX MCP utility functions
 """
 
-import sys
-import os
 import unittest
 from unittest.mock import patch, MagicMock
 
-# Add parent directory to path to import modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from utils.multimodal import process_text_query, process_voice_input, process_handwriting
 from utils.assessment import generate_question, evaluate_student_answer
 
@@ -17,36 +12,25 @@ from utils.assessment import generate_question, evaluate_student_answer
 class TestMultimodalUtils(unittest.TestCase):
     """Test cases for multimodal utility functions"""
     
+    TEXT_QUERY_KEYS = frozenset({"query", "response_type", "response"})
+    SOLVE_QUERY_KEYS = TEXT_QUERY_KEYS | {"confidence", "timestamp"}
+    
     def test_process_text_query(self):
         """Test text query processing"""
-        # Test with a "solve" query
-        solve_query = "Please solve this equation: 2x + 3 = 7"
-        result = process_text_query(solve_query)
-        
-        self.assertIsInstance(result, dict)
-        self.assertEqual(result["query"], solve_query)
-        self.assertEqual(result["response_type"], "math_solution")
-        self.assertIn("response", result)
-        self.assertIn("confidence", result)
-        self.assertIn("timestamp", result)
-        
-        # Test with "what is" query
-        what_is_query = "What is a quadratic equation?"
-        result = process_text_query(what_is_query)
-        
-        self.assertIsInstance(result, dict)
-        self.assertEqual(result["query"], what_is_query)
-        self.assertEqual(result["response_type"], "definition")
-        self.assertIn("response", result)
-        
-        # Test with unknown query
-        unknown_query = "Something completely different"
-        result = process_text_query(unknown_query)
-        
-        self.assertIsInstance(result, dict)
-        self.assertEqual(result["query"], unknown_query)
-        self.assertEqual(result["response_type"], "general")
-        self.assertIn("response", result)
+        cases = [
+            ("Please solve this equation: 2x + 3 = 7", "math_solution", self.SOLVE_QUERY_KEYS),
+            ("What is a quadratic equation?", "definition", self.TEXT_QUERY_KEYS),
+            ("Something completely different", "general", self.TEXT_QUERY_KEYS),
+        ]
+        
+        for query, response_type, expected_keys in cases:
+            with self.subTest(query=query):
+                result = process_text_query(query)
+                
+                self.assertIsInstance(result, dict)
+                self.assertGreaterEqual(result.keys(), expected_keys)
+                self.assertEqual(result["query"], query)
+                self.assertEqual(result["response_type"], response_type)
         
     def test_process_voice_input(self):
         """Test voice input processing"""
@@ -78,6 +62,10 @@ class TestMultimodalUtils(unittest.TestCase):
 class TestAssessmentUtils(unittest.TestCase):
     """Test cases for assessment utility functions"""
     
+    QUESTION_KEYS = frozenset({"id", "concept_id", "difficulty", "text", "solution", "answer", "variables"})
+    LINEAR_QUESTION_KEYS = frozenset({"concept_id", "difficulty", "text", "solution", "answer"})
+    EVAL_KEYS = frozenset({"question_id", "is_correct", "correct_answer", "student_answer"})
+    
     def test_generate_question_algebra_basics(self):
         """Test question generation for algebra basics"""
         concept_id = "math_algebra_basics"
@@ -86,13 +74,9 @@ class TestAssessmentUtils(unittest.TestCase):
         question = generate_question(concept_id, difficulty)
         
         self.assertIsInstance(question, dict)
-        self.assertIn("id", question)
+        self.assertGreaterEqual(question.keys(), self.QUESTION_KEYS)
         self.assertEqual(question["concept_id"], concept_id)
         self.assertEqual(question["difficulty"], difficulty)
-        self.assertIn("text", question)
-        self.assertIn("solution", question)
-        self.assertIn("answer", question)
-        self.assertIn("variables", question)
     
     def test_generate_question_linear_equations(self):
         """Test question generation for linear equations"""
@@ -102,11 +86,9 @@ class TestAssessmentUtils(unittest.TestCase):
         question = generate_question(concept_id, difficulty)
         
         self.assertIsInstance(question, dict)
+        self.assertGreaterEqual(question.keys(), self.LINEAR_QUESTION_KEYS)
         self.assertEqual(question["concept_id"], concept_id)
         self.assertEqual(question["difficulty"], difficulty)
-        self.assertIn("text", question)
-        self.assertIn("solution", question)
-        self.assertIn("answer", question)
     
     def test_evaluate_student_answer_correct(self):
         """Test student answer evaluation - correct answer"""
@@ -125,6 +107,7 @@ class TestAssessmentUtils(unittest.TestCase):
         result = evaluate_student_answer(question, correct_answer)
         
         self.assertIsInstance(result, dict)
+        self.assertGreaterEqual(result.keys(), self.EVAL_KEYS)
         self.assertEqual(result["question_id"], question["id"])
         self.assertTrue(result["is_correct"])
         self.assertIsNone(result["error_type"])
@@ -148,6 +131,7 @@ class TestAssessmentUtils(unittest.TestCase):
         result = evaluate_student_answer(question, incorrect_answer)
         
         self.assertIsInstance(result, dict)
+        self.assertGreaterEqual(result.keys(), self.EVAL_KEYS)
         self.assertEqual(result["question_id"], question["id"])
         self.assertFalse(result["is_correct"])
         self.assertEqual(result["correct_answer"], question["answer"])